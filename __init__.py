@@ -32,6 +32,10 @@
 - `@\w+` - 匹配@用户名格式
 - `订单.*完成` - 匹配"订单XXX完成"
 
+### 可选依赖
+- 安装 `pyahocorasick` 后，模糊匹配模式会使用 AC 自动机一次扫描匹配全部关键词，关键词较多时速度更快
+- 安装 `regex` 后，正则表达式匹配的超时保护（`正则表达式超时时间` 配置项）由正则引擎实现，可在任意线程中生效；未安装时退回 SIGALRM 方式，仅在主线程中生效
+
 ## 常见使用示例
 
 ### 普通关键词监听：
@@ -110,10 +114,14 @@ onebot_v11-group_123456|(重要|紧急|urgent),@\w*管理员,错误\d+|onebot_v1
 ```
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Set, Tuple
+import asyncio
 import time
 import json
 import re
+import signal
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 from nekro_agent.api import core
@@ -123,6 +131,23 @@ from nekro_agent.api.signal import MsgSignal
 from nekro_agent.api.plugin import NekroPlugin, ConfigBase, ExtraField, SandboxMethodType
 from pydantic import Field
 
+try:
+    import ahocorasick  # 可选依赖，用于加速模糊匹配
+except ImportError:
+    ahocorasick = None
+
+try:
+    import regex  # 可选依赖，提供引擎内置的匹配超时，可在任意线程中使用
+except ImportError:
+    regex = None
+
+# 用户编写的正则统一由该引擎编译，保证验证与匹配时的语法一致
+regex_engine = regex if regex is not None else re
+
+# 匹配模式描述，下标与 MATCH_MODE 对应
+_MODE_DESC: Tuple[str, ...] = ("模糊", "精确", "正则")
+_MODE_NAMES: Tuple[str, ...] = ("模糊匹配", "精确匹配", "正则表达式")
+
 # 创建插件实例
 plugin = NekroPlugin(
     name="关键词监听订阅",
@@ -195,22 +220,23 @@ async def initialize_plugin():
     if rules_count > 0:
         core.logger.info(f"已加载 {rules_count} 条监听规则")
         
-        # 验证正则表达式
+        # 预编译监听规则，同时完成正则表达式验证
+        rule_index = get_rule_index(config)
+        
         if config.MATCH_MODE == 2:
             core.logger.info("正则表达式模式已启用，正在验证规则...")
-            for idx, rule_str in enumerate(config.MONITOR_RULES, 1):
-                parsed = parse_rule(rule_str)
-                if parsed:
-                    _, keywords, _ = parsed
-                    for keyword in keywords:
-                        if not validate_regex(keyword):
+            if regex is None:
+                core.logger.warning("未安装 regex 库，正则表达式超时保护仅在主线程中通过 SIGALRM 生效")
+            for idx, rule in enumerate(rule_index.rules, 1):
+                if rule:
+                    for keyword, valid in zip(rule.keywords, rule.valid_patterns):
+                        if not valid:
                             core.logger.warning(f"规则{idx}中的正则表达式无效: {keyword}")
         
-        for idx, rule_str in enumerate(config.MONITOR_RULES, 1):
-            parts = rule_str.split('|')
-            if len(parts) == 3:
-                mode_desc = ["模糊", "精确", "正则"][config.MATCH_MODE]
-                core.logger.info(f"规则{idx}: 监听 {parts[0]}, 关键词 [{parts[1]}] ({mode_desc}模式), 通知到 {parts[2]}")
+        for idx, rule in enumerate(rule_index.rules, 1):
+            if rule:
+                mode_desc = _MODE_DESC[config.MATCH_MODE]
+                core.logger.info(f"规则{idx}: 监听 {rule.monitor_channel}, 关键词 [{','.join(rule.keywords)}] ({mode_desc}模式), 通知到 {rule.notify_channel}")
     else:
         core.logger.warning("未配置任何监听规则")
     
@@ -241,6 +267,119 @@ def parse_rule(rule_str: str) -> Optional[tuple]:
     return (monitor_channel, keywords, notify_channel)
 
 
+class CompiledRule(NamedTuple):
+    """预处理后的监听规则"""
+
+    rule_str: str  # 原始规则字符串
+    monitor_channel: str
+    keywords: List[str]
+    notify_channel: str
+    rule_key: str  # 通知间隔记录使用的键
+    valid_patterns: List[bool]  # 各关键词是否为有效正则，仅正则模式下可能为 False
+    pattern: Optional[Pattern] = None  # 全部关键词合并成的单个正则，分组 k{i} 对应 keywords[i]
+    patterns: Tuple[Optional[Pattern], ...] = ()  # 正则模式下无法合并时逐个匹配，无效的正则为 None
+    automaton: Optional[Any] = None  # 模糊匹配且安装了 pyahocorasick 时使用的 AC 自动机
+    min_len: int = 0  # 能够命中的最短文本长度，正则模式下为 0
+    literal: Optional[str] = None  # 模糊匹配且只有一个关键词时直接做子串查找
+    keyword_set: Optional[FrozenSet[str]] = None  # 精确匹配时的关键词集合
+
+
+class RuleIndex(NamedTuple):
+    """当前配置下全部规则的编译结果"""
+
+    rules: List[Optional[CompiledRule]]  # 与 MONITOR_RULES 顺序一致，格式错误的规则为 None
+    by_channel: Dict[str, List[CompiledRule]]  # 按监听频道分组
+    notify_format: Callable[..., str]  # 绑定好的通知模板格式化方法
+
+
+# 已编译规则缓存：(规则列表快照, 匹配模式, 通知模板) -> 编译结果，配置变化时重建
+_rule_index: Optional[Tuple[tuple, RuleIndex]] = None
+
+
+def compile_rule(rule_str: str, mode: int) -> Optional[CompiledRule]:
+    """解析并预编译单条监听规则
+    
+    Args:
+        rule_str: 规则字符串
+        mode: 匹配模式 (0=模糊, 1=精确, 2=正则)
+    
+    Returns:
+        编译后的规则，格式错误时返回 None
+    """
+    parsed = parse_rule(rule_str)
+    if not parsed:
+        return None
+    
+    monitor_channel, keywords, notify_channel = parsed
+    rule = CompiledRule(
+        rule_str,
+        monitor_channel,
+        keywords,
+        notify_channel,
+        f"{monitor_channel}_{notify_channel}",
+        [True] * len(keywords),
+    )
+    if mode in (0, 1):
+        # 文本比最短关键词还短时不可能命中
+        rule = rule._replace(min_len=min(len(kw) for kw in keywords))
+    
+    if mode == 0 and len(keywords) == 1:  # 模糊匹配：单个关键词无需正则或自动机
+        return rule._replace(literal=keywords[0])
+    
+    if mode == 0 and ahocorasick is not None:  # 模糊匹配：AC 自动机一遍扫描找出任一关键词
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return rule._replace(automaton=automaton)
+    
+    if mode == 0:  # 模糊匹配：任一关键词出现即命中
+        alternatives = [f"(?P<k{idx}>{re.escape(kw)})" for idx, kw in enumerate(keywords)]
+        return rule._replace(pattern=re.compile("|".join(alternatives)))
+    
+    if mode == 1:  # 精确匹配：按空白分词后在关键词集合中查找，含空白的关键词不可能命中
+        return rule._replace(keyword_set=frozenset(kw for kw in keywords if len(kw.split()) == 1))
+    
+    if mode != 2:
+        return rule
+    
+    # 正则表达式匹配
+    patterns: List[Optional[Pattern]] = []
+    for keyword in keywords:
+        try:
+            patterns.append(regex_engine.compile(keyword))
+        except regex_engine.error:
+            patterns.append(None)
+    rule = rule._replace(valid_patterns=[p is not None for p in patterns])
+    
+    # 用户正则自带分组时合并会打乱反向引用的编号，只合并不含分组的正则
+    valid = [(idx, p) for idx, p in enumerate(patterns) if p is not None]
+    if valid and all(p.groups == 0 for _, p in valid):
+        try:
+            return rule._replace(pattern=regex_engine.compile("|".join(f"(?P<k{idx}>{p.pattern})" for idx, p in valid)))
+        except regex_engine.error:
+            # 例如含有全局内联标志 (?i) 的正则无法放在中间，保留逐个匹配
+            pass
+    
+    return rule._replace(patterns=tuple(patterns))
+
+
+def get_rule_index(config: "KeywordMonitorConfig") -> RuleIndex:
+    """获取当前配置的已编译规则，仅在规则、匹配模式或通知模板变化时重新编译"""
+    global _rule_index
+    
+    cache_key = (tuple(config.MONITOR_RULES), config.MATCH_MODE, config.NOTIFY_TEMPLATE)
+    if _rule_index is None or _rule_index[0] != cache_key:
+        rules = [compile_rule(rule_str, config.MATCH_MODE) for rule_str in config.MONITOR_RULES]
+        by_channel: Dict[str, List[CompiledRule]] = {}
+        for rule in rules:
+            if rule:
+                by_channel.setdefault(rule.monitor_channel, []).append(rule)
+        _rule_index = (cache_key, RuleIndex(rules, by_channel, config.NOTIFY_TEMPLATE.format))
+    
+    return _rule_index[1]
+
+
 def validate_regex(pattern: str) -> bool:
     """验证正则表达式是否有效
     
@@ -251,80 +390,205 @@ def validate_regex(pattern: str) -> bool:
         是否有效
     """
     try:
-        re.compile(pattern)
+        regex_engine.compile(pattern)
         return True
-    except re.error:
+    except regex_engine.error:
         return False
 
 
-def check_keywords(text: str, keywords: List[str], mode: int, timeout: float = 1.0) -> Optional[str]:
-    """检查文本是否包含关键词
+def normalize_timeout(timeout: Optional[float]) -> Optional[float]:
+    """统一超时配置的含义：None 或小于等于 0 表示不限制，返回 None"""
+    return timeout if timeout and timeout > 0 else None
+
+
+@contextmanager
+def regex_timeout_guard(timeout: Optional[float]):
+    """未安装 regex 时，用 SIGALRM 为一条规则的正则匹配设置超时保护
+    
+    安装了 regex 时由引擎自身负责超时，此处不做处理。SIGALRM 只能在主线程安装，
+    且部分平台不支持，此时不做超时限制。
+    
+    Args:
+        timeout: 超时时间（秒），None 或小于等于 0 表示不限制
+    
+    Raises:
+        TimeoutError: 正则表达式匹配超时
+    """
+    if (
+        regex is not None
+        or normalize_timeout(timeout) is None
+        or not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+    
+    def timeout_handler(signum, frame):
+        raise TimeoutError("正则表达式匹配超时")
+    
+    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        # 清除超时
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+
+def regex_search(pattern: Pattern, text: str, timeout: Optional[float] = None):
+    """执行正则匹配，安装了 regex 时带超时保护
+    
+    Args:
+        pattern: 已编译的正则表达式
+        text: 要匹配的文本
+        timeout: 超时时间（秒），None 表示不限制
+    
+    Raises:
+        TimeoutError: 正则表达式匹配超时
+    """
+    timeout = normalize_timeout(timeout)
+    if timeout is not None and regex is not None:
+        return pattern.search(text, timeout=timeout)
+    return pattern.search(text)
+
+
+def check_fuzzy(text: str, rule: CompiledRule, timeout: Optional[float] = None) -> Optional[str]:
+    """模糊匹配：文本包含任一关键词即命中
     
     Args:
         text: 要检查的文本
-        keywords: 关键词列表
-        mode: 匹配模式 (0=模糊, 1=精确, 2=正则)
-        timeout: 正则表达式超时时间
+        rule: 已编译的监听规则
+        timeout: 未使用，与其他匹配函数保持一致
     
     Returns:
         匹配到的关键词，或 None
     """
-    for keyword in keywords:
-        try:
-            if mode == 0:  # 模糊匹配
-                if keyword in text:
-                    return keyword
-            elif mode == 1:  # 精确匹配
-                words = text.split()
-                if keyword in words:
-                    return keyword
-            elif mode == 2:  # 正则表达式匹配
-                # 验证正则表达式
-                if not validate_regex(keyword):
-                    core.logger.warning(f"无效的正则表达式，跳过: {keyword}")
-                    continue
-                
-                # 编译正则表达式
-                pattern = re.compile(keyword)
-                
-                # 执行匹配（带超时保护）
-                import signal
-                
-                def timeout_handler(signum, frame):
-                    raise TimeoutError("正则表达式匹配超时")
-                
-                # 设置超时
-                old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(int(timeout))
-                
-                try:
-                    match = pattern.search(text)
-                    if match:
-                        return keyword
-                finally:
-                    # 清除超时
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
-                    
-        except TimeoutError:
-            core.logger.warning(f"正则表达式匹配超时，跳过: {keyword}")
-            continue
-        except Exception as e:
-            core.logger.error(f"关键词匹配时出错: {keyword}, 错误: {e}")
-            continue
+    if len(text) < rule.min_len:
+        return None
+    
+    if rule.literal is not None:
+        return rule.literal if rule.literal in text else None
+    
+    if rule.automaton is not None:
+        for _, keyword in rule.automaton.iter(text):
+            return keyword
+        return None
+    
+    # 合并后的正则只需扫描一遍文本，通过命中的分组名找回原关键词
+    match = rule.pattern.search(text)
+    return rule.keywords[int(match.lastgroup[1:])] if match else None
+
+
+def check_exact(text: str, rule: CompiledRule, timeout: Optional[float] = None) -> Optional[str]:
+    """精确匹配：按空白分词后某个词与关键词完全相同即命中
+    
+    Args:
+        text: 要检查的文本
+        rule: 已编译的监听规则
+        timeout: 未使用，与其他匹配函数保持一致
+    
+    Returns:
+        匹配到的关键词，或 None
+    """
+    if len(text) < rule.min_len:
+        return None
+    
+    # 整条消息就是一个关键词时无需分词，字符串的哈希值会被缓存，多条规则间复用
+    if text in rule.keyword_set:
+        return text
+    
+    # 只分词一次，每个词做一次哈希查找
+    for word in text.split():
+        if word in rule.keyword_set:
+            return word
+    return None
+
+
+def check_regex(text: str, rule: CompiledRule, timeout: Optional[float] = None) -> Optional[str]:
+    """正则表达式匹配：任一正则命中即触发
+    
+    Args:
+        text: 要检查的文本
+        rule: 已编译的监听规则
+        timeout: 正则表达式超时时间，None 表示不限制
+    
+    Returns:
+        匹配到的关键词，或 None
+    
+    Raises:
+        TimeoutError: 正则表达式匹配超时
+    """
+    if rule.pattern is not None:
+        # 合并后的正则只需扫描一遍文本，通过命中的分组名找回原关键词
+        match = regex_search(rule.pattern, text, timeout)
+        return rule.keywords[int(match.lastgroup[1:])] if match else None
+    
+    # 无法合并的正则逐个匹配，无效的正则直接跳过
+    for keyword, pattern in zip(rule.keywords, rule.patterns):
+        if pattern is not None and regex_search(pattern, text, timeout):
+            return keyword
     
     return None
 
 
+# 各匹配模式对应的匹配函数，下标与 MATCH_MODE 对应
+_CHECKERS: Tuple[Callable[[str, CompiledRule, Optional[float]], Optional[str]], ...] = (
+    check_fuzzy,
+    check_exact,
+    check_regex,
+)
+
+
+# 最后通知时间以内存为准，plugin.store 仅用于持久化
+_last_notify: Dict[str, float] = {}
+
+# 后台持久化任务，保留引用避免任务被提前回收
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task):
+    """回收后台任务并记录异常"""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        core.logger.error(f"[监听] 持久化数据失败: {task.exception()}")
+
+
+def run_in_background(coro: Coroutine):
+    """在后台执行存储写入，不阻塞消息处理"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
 async def get_last_notify_time(rule_key: str) -> float:
-    """获取某规则的最后通知时间"""
-    time_str = await plugin.store.get(store_key=f"notify_time_{rule_key}")
-    return float(time_str) if time_str else 0
+    """获取某规则的最后通知时间，首次访问时从存储加载"""
+    last_time = _last_notify.get(rule_key)
+    if last_time is None:
+        time_str = await plugin.store.get(store_key=f"notify_time_{rule_key}")
+        # 等待期间可能已有并发调用写入了更新的时间，此时以内存中的为准
+        last_time = _last_notify.setdefault(rule_key, float(time_str) if time_str else 0)
+    return last_time
+
+
+def set_last_notify_time(rule_key: str, timestamp: float):
+    """设置某规则的最后通知时间，并在后台写入存储"""
+    _last_notify[rule_key] = timestamp
+    run_in_background(plugin.store.set(store_key=f"notify_time_{rule_key}", value=str(timestamp)))
+
+
+# 当前时间字符串缓存：(整秒时间戳, 格式化结果)，同一秒内的通知复用
+_time_cache: Tuple[int, str] = (0, "")
 
 
-async def set_last_notify_time(rule_key: str, timestamp: float):
-    """设置某规则的最后通知时间"""
-    await plugin.store.set(store_key=f"notify_time_{rule_key}", value=str(timestamp))
+def _now_str() -> str:
+    """获取当前时间的格式化字符串"""
+    global _time_cache
+    
+    now = int(time.time())
+    if _time_cache[0] != now:
+        _time_cache = (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+    return _time_cache[1]
 
 
 # 用户消息回调
@@ -332,83 +596,88 @@ async def set_last_notify_time(rule_key: str, timestamp: float):
 async def handle_user_message(_ctx: AgentCtx, message: ChatMessage) -> MsgSignal | None:
     """处理用户消息，检查是否触发关键词"""
     
-    try:
-        config = plugin.get_config(KeywordMonitorConfig)
+    config = plugin.get_config(KeywordMonitorConfig)
+    
+    # 获取当前频道
+    current_channel = _ctx.chat_key
+    if not current_channel:
+        return None
+    
+    # 每条消息只读取一次配置项
+    debug = config.ENABLE_DEBUG
+    match_mode = config.MATCH_MODE
+    text = message.content_text
+    
+    if debug:
+        core.logger.debug(f"[监听] 收到消息，频道: {current_channel}")
+    
+    # 未知的匹配模式不会命中任何关键词
+    if not 0 <= match_mode < len(_CHECKERS):
+        return None
+    checker = _CHECKERS[match_mode]
+    
+    # 只取监听当前频道的规则
+    rule_index = get_rule_index(config)
+    rules = rule_index.by_channel.get(current_channel)
+    if not rules:
+        return None
+    
+    # 先完成所有规则的关键词匹配，再统一发送通知
+    matched_rules: List[Tuple[CompiledRule, str]] = []
+    timeout = normalize_timeout(config.REGEX_TIMEOUT) if match_mode == 2 else None
+    mode_desc = _MODE_DESC[match_mode] if debug else ""
+    for rule in rules:
+        if debug:
+            core.logger.debug(f"[监听] 匹配到监听频道，检查关键词: {rule.keywords} ({mode_desc}模式)")
         
-        # 获取当前频道
-        current_channel = _ctx.chat_key
-        if not current_channel:
-            return None
+        # 检查关键词
+        try:
+            with regex_timeout_guard(timeout):
+                matched_keyword = checker(text, rule, timeout)
+        except TimeoutError:
+            core.logger.warning(f"[监听] 正则表达式匹配超时，跳过规则: {rule.rule_str}")
+            continue
         
-        if config.ENABLE_DEBUG:
-            core.logger.debug(f"[监听] 收到消息，频道: {current_channel}")
+        if matched_keyword:
+            matched_rules.append((rule, matched_keyword))
+    
+    for rule, matched_keyword in matched_rules:
+        notify_channel = rule.notify_channel
         
-        # 检查所有监听规则
-        for rule_str in config.MONITOR_RULES:
-            parsed = parse_rule(rule_str)
-            if not parsed:
-                continue
-            
-            monitor_channel, keywords, notify_channel = parsed
-            
-            # 检查是否是要监听的频道
-            if monitor_channel != current_channel:
-                continue
-            
-            if config.ENABLE_DEBUG:
-                mode_desc = ["模糊", "精确", "正则"][config.MATCH_MODE]
-                core.logger.debug(f"[监听] 匹配到监听频道，检查关键词: {keywords} ({mode_desc}模式)")
-            
-            # 检查关键词
-            matched_keyword = check_keywords(
-                message.content_text,
-                keywords,
-                config.MATCH_MODE,
-                config.REGEX_TIMEOUT
-            )
-            
-            if not matched_keyword:
-                continue
-            
-            core.logger.info(f"[监听] 触发关键词 '{matched_keyword}'")
-            
-            # 检查通知间隔
-            rule_key = f"{monitor_channel}_{notify_channel}"
-            last_time = await get_last_notify_time(rule_key)
-            current_time = time.time()
-            
-            if current_time - last_time < config.NOTIFY_INTERVAL:
-                if config.ENABLE_DEBUG:
-                    core.logger.debug(f"[监听] 通知间隔未满，跳过")
-                continue
-            
-            # 构建通知消息
-            notify_text = config.NOTIFY_TEMPLATE.format(
+        core.logger.info(f"[监听] 触发关键词 '{matched_keyword}'")
+        
+        # 检查通知间隔
+        last_time = await get_last_notify_time(rule.rule_key)
+        current_time = time.time()
+        
+        if current_time - last_time < config.NOTIFY_INTERVAL:
+            if debug:
+                core.logger.debug(f"[监听] 通知间隔未满，跳过")
+            continue
+        
+        # 构建并发送通知，模板配置错误也按发送失败记录
+        try:
+            notify_text = rule_index.notify_format(
                 channel_name=_ctx.channel_name or "未知频道",
                 channel_id=_ctx.channel_id or "未知",
                 keyword=matched_keyword,
-                content=message.content_text[:200],
-                time=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                content=text[:200],
+                time=_now_str()
             )
             
-            # 发送通知
-            try:
-                await send_text(
-                    chat_key=notify_channel,
-                    message=notify_text,
-                    ctx=_ctx
-                )
-                
-                # 更新最后通知时间
-                await set_last_notify_time(rule_key, current_time)
-                
-                core.logger.info(f"[监听] 已发送通知到 {notify_channel}")
-                
-            except Exception as e:
-                core.logger.error(f"[监听] 发送通知失败: {e}")
-    
-    except Exception as e:
-        core.logger.error(f"[监听] 处理消息时出错: {e}")
+            await send_text(
+                chat_key=notify_channel,
+                message=notify_text,
+                ctx=_ctx
+            )
+            
+            # 更新最后通知时间
+            set_last_notify_time(rule.rule_key, current_time)
+            
+            core.logger.info(f"[监听] 已发送通知到 {notify_channel}")
+            
+        except Exception as e:
+            core.logger.error(f"[监听] 发送通知失败: {e}")
     
     # 不阻止消息的正常处理
     return None
@@ -431,30 +700,27 @@ async def list_monitor_rules(_ctx: AgentCtx) -> str:
     if not config.MONITOR_RULES:
         return "当前没有配置任何监听规则"
     
-    mode_names = ["模糊匹配", "精确匹配", "正则表达式"]
-    current_mode = mode_names[config.MATCH_MODE] if config.MATCH_MODE < len(mode_names) else "未知模式"
+    current_mode = _MODE_NAMES[config.MATCH_MODE] if config.MATCH_MODE < len(_MODE_NAMES) else "未知模式"
     
     result = f"📋 当前监听规则 ({current_mode})：\n"
     result += "=" * 40 + "\n"
     
-    for idx, rule_str in enumerate(config.MONITOR_RULES, 1):
-        parsed = parse_rule(rule_str)
-        if parsed:
-            monitor, keywords, notify = parsed
+    for idx, rule in enumerate(get_rule_index(config).rules, 1):
+        if rule:
+            monitor, keywords, notify = rule.monitor_channel, rule.keywords, rule.notify_channel
             result += f"\n规则 {idx}:\n"
             result += f"  监听: {monitor}\n"
             result += f"  关键词: {', '.join(keywords)}\n"
             result += f"  通知到: {notify}\n"
             
-            # 正则表达式模式下验证规则
+            # 正则表达式模式下显示编译时发现的无效规则
             if config.MATCH_MODE == 2:
-                invalid_patterns = [kw for kw in keywords if not validate_regex(kw)]
+                invalid_patterns = [kw for kw, valid in zip(keywords, rule.valid_patterns) if not valid]
                 if invalid_patterns:
                     result += f"  ⚠️ 无效正则: {', '.join(invalid_patterns)}\n"
             
             # 显示最后通知时间
-            rule_key = f"{monitor}_{notify}"
-            last_time = await get_last_notify_time(rule_key)
+            last_time = await get_last_notify_time(rule.rule_key)
             if last_time > 0:
                 last_notify = datetime.fromtimestamp(last_time).strftime("%Y-%m-%d %H:%M:%S")
                 result += f"  最后通知: {last_notify}\n"
@@ -480,17 +746,24 @@ async def test_regex_pattern(_ctx: AgentCtx, pattern: str, test_text: str = "")
     Returns:
         测试结果
     """
-    # 验证正则表达式语法
-    if not validate_regex(pattern):
-        return f"❌ 正则表达式语法错误: {pattern}"
+    # 验证正则表达式语法，编译结果直接用于后续匹配测试
+    try:
+        compiled_pattern = regex_engine.compile(pattern)
+    except regex_engine.error as e:
+        return f"❌ 正则表达式语法错误: {pattern} ({e})"
     
     result = f"✅ 正则表达式语法正确: {pattern}\n"
     
     # 如果提供了测试文本，进行匹配测试
     if test_text.strip():
         try:
-            compiled_pattern = re.compile(pattern)
-            matches = compiled_pattern.findall(test_text)
+            config = plugin.get_config(KeywordMonitorConfig)
+            timeout = normalize_timeout(config.REGEX_TIMEOUT)
+            if regex is not None:
+                matches = compiled_pattern.findall(test_text, timeout=timeout)
+            else:
+                with regex_timeout_guard(timeout):
+                    matches = compiled_pattern.findall(test_text)
             
             if matches:
                 result += f"✅ 匹配成功，找到 {len(matches)} 个匹配项:\n"
@@ -509,6 +782,24 @@ async def test_regex_pattern(_ctx: AgentCtx, pattern: str, test_text: str = "")
     return result
 
 
+# 临时规则以内存为准，首次使用时从存储加载，修改后在后台写回
+_temp_rules: Optional[List[str]] = None
+_temp_rule_set: Set[str] = set()
+
+
+async def get_temp_rules() -> Tuple[List[str], Set[str]]:
+    """获取临时规则列表及用于去重的集合"""
+    global _temp_rules, _temp_rule_set
+    
+    if _temp_rules is None:
+        temp_rules_str = await plugin.store.get(store_key="temp_rules")
+        # 并发的首次加载可能已先完成并追加了规则，此时不能覆盖
+        if _temp_rules is None:
+            _temp_rules = json.loads(temp_rules_str) if temp_rules_str else []
+            _temp_rule_set = set(_temp_rules)
+    return _temp_rules, _temp_rule_set
+
+
 # 沙盒方法：添加监听规则（动态添加到存储中）
 @plugin.mount_sandbox_method(
     method_type=SandboxMethodType.BEHAVIOR,
@@ -543,21 +834,19 @@ async def add_temp_monitor_rule(
         if invalid_patterns:
             return f"错误：以下正则表达式无效: {', '.join(invalid_patterns)}"
     
-    # 存储临时规则
-    temp_rules_str = await plugin.store.get(store_key="temp_rules")
-    temp_rules = json.loads(temp_rules_str) if temp_rules_str else []
-    
     # 构建新规则
     new_rule = f"{monitor_channel}|{keywords}|{notify_channel}"
     
     # 检查是否已存在
-    if new_rule in temp_rules:
+    temp_rules, temp_rule_set = await get_temp_rules()
+    if new_rule in temp_rule_set:
         return "该规则已存在"
     
     temp_rules.append(new_rule)
-    await plugin.store.set(store_key="temp_rules", value=json.dumps(temp_rules))
+    temp_rule_set.add(new_rule)
+    run_in_background(plugin.store.set(store_key="temp_rules", value=json.dumps(temp_rules)))
     
-    mode_desc = ["模糊", "精确", "正则"][config.MATCH_MODE]
+    mode_desc = _MODE_DESC[config.MATCH_MODE]
     return f"✅ 已添加临时规则：监听 {monitor_channel}，关键词 [{keywords}] ({mode_desc}模式)，通知到 {notify_channel}"
 
 
@@ -566,4 +855,9 @@ async def add_temp_monitor_rule(
 async def cleanup_plugin():
     """清理插件"""
     core.logger.info(f"插件 '{plugin.name}' 正在清理...")
+    
+    # 等待尚未完成的持久化任务
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+    
     core.logger.info(f"插件 '{plugin.name}' 清理完成")